@@ -0,0 +1,36 @@
+"""add active sessions partial index
+
+Revision ID: 3f8d2a6c1b94
+Revises: 7419fbe7b31c
+Create Date: 2026-10-15 05:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8d2a6c1b94'
+down_revision: Union[str, Sequence[str], None] = '7419fbe7b31c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index for a user's active sessions, newest first
+    op.create_index(
+        'ix_sessions_user_created_active',
+        'chat_sessions',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+        sqlite_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sessions_user_created_active', table_name='chat_sessions')
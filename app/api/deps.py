@@ -0,0 +1,30 @@
+"""Service dependencies for API endpoints"""
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.services.chat_service import ChatService
+from app.services.context_service import ContextService
+from app.services.session_service import SessionService
+from app.services.user_service import UserService
+
+
+def get_chat_service(session: AsyncSession = Depends(get_session)) -> ChatService:
+    """FastAPI dependency providing a ChatService bound to the request session."""
+    return ChatService(session)
+
+
+def get_context_service(session: AsyncSession = Depends(get_session)) -> ContextService:
+    """FastAPI dependency providing a ContextService bound to the request session."""
+    return ContextService(session)
+
+
+def get_session_service(session: AsyncSession = Depends(get_session)) -> SessionService:
+    """FastAPI dependency providing a SessionService bound to the request session."""
+    return SessionService(session)
+
+
+def get_user_service(session: AsyncSession = Depends(get_session)) -> UserService:
+    """FastAPI dependency providing a UserService bound to the request session."""
+    return UserService(session)
@@ -1,22 +1,47 @@
 """Chat endpoint with SSE streaming"""
 
+from contextlib import aclosing
+
 from fastapi import APIRouter, Depends, Request, Header
-from sqlalchemy.ext.asyncio import AsyncSession
-from sse_starlette.sse import EventSourceResponse
-import json
+from fastapi.responses import StreamingResponse
+import orjson
 
-from app.db.session import get_session
+from app.api.deps import get_chat_service
+from app.core.config import settings
 from app.services.chat_service import ChatService
 from app.schemas.chat import ChatRequest
 from app.core.rate_limiter import limiter, get_rate_limit_string
 from app.core.logging import get_logger, LogContext
-from app.utils.ids import generate_request_id
+from app.utils.streaming import SSE_HEADERS, batched, with_keepalive
 
 
 router = APIRouter(tags=["Chat"])
 
 logger = get_logger(__name__)
 
+# Pre-encoded SSE event field lines
+_EVENT_SESSION_CREATED = b"event: session_created\ndata: "
+_EVENT_DONE = b"event: done\ndata: "
+_EVENT_ERROR = b"event: error\ndata: "
+_FRAME_END = b"\n\n"
+
+# Token frames have a fixed shape, so only the token string itself is encoded
+_TOKEN_FRAME_START = b'event: token\ndata: {"token":'
+_TOKEN_FRAME_END = b"}\n\n"
+
+# Poll for client disconnect every N token frames
+_DISCONNECT_CHECK_INTERVAL = 8
+
+
+def _sse_frame(event: bytes, payload: dict) -> bytes:
+    """Build a complete SSE frame as bytes."""
+    return event + orjson.dumps(payload) + _FRAME_END
+
+
+def _token_frame(token: str) -> bytes:
+    """Build a token SSE frame from the pre-encoded template."""
+    return _TOKEN_FRAME_START + orjson.dumps(token) + _TOKEN_FRAME_END
+
 
 @router.post("/chat")
 @limiter.limit(get_rate_limit_string())
@@ -24,16 +49,13 @@ async def chat(
     request: Request,
     chat_request: ChatRequest,
     x_user_id: str | None = Header(None, alias="X-User-ID"),
-    session: AsyncSession = Depends(get_session),
-) -> EventSourceResponse:
+    service: ChatService = Depends(get_chat_service),
+) -> StreamingResponse:
     """
     Send a message and receive a streaming response.
 
     Returns Server-Sent Events (SSE) stream with tokens.
     """
-    request_id = generate_request_id()
-    service = ChatService(session)
-
     # Determine user_id (header preferred)
     user_id = x_user_id
 
@@ -44,49 +66,49 @@ async def chat(
         user_id
     )
 
-    with LogContext(
-        request_id=request_id,
-        session_id=str(session_id),
-    ):
-        logger.info(f"Chat request received: {len(chat_request.message)} chars")
+    # Request ID is inherited from RequestLoggingMiddleware
+    with LogContext(session_id=str(session_id)):
+        logger.info("Chat request received: %d chars", len(chat_request.message))
 
         async def event_generator():
             """Generate SSE events from chat response."""
             try:
                 # 1. Yield session ID immediately so client can track context
-                yield {
-                    "event": "session_created",
-                    "data": json.dumps({"session_id": str(session_id)}),
-                }
+                yield _sse_frame(
+                    _EVENT_SESSION_CREATED, {"session_id": str(session_id)}
+                )
 
-                # 2. Stream tokens
-                async for token in service.handle_chat(
+                # 2. Stream tokens (tokens arriving close together share one frame)
+                # aclosing() tears down the LLM stream as soon as we stop reading.
+                async with aclosing(batched(service.handle_chat(
                     user_message=chat_request.message,
                     session_id=session_id,
                     user_id=user_id,
-                ):
-                    yield {
-                        "event": "token",
-                        "data": json.dumps({"token": token}),
-                    }
+                ))) as batches:
+                    frame_count = 0
+                    async for text in batches:
+                        yield _token_frame(text)
+
+                        frame_count += 1
+                        if (
+                            frame_count % _DISCONNECT_CHECK_INTERVAL == 0
+                            and await request.is_disconnected()
+                        ):
+                            logger.info("Client disconnected, stopping stream")
+                            return
 
                 # 3. Done event
-                yield {
-                    "event": "done",
-                    "data": json.dumps({
-                        "status": "complete", 
-                        "session_id": str(session_id)
-                    }),
-                }
+                yield _sse_frame(_EVENT_DONE, {
+                    "status": "complete", 
+                    "session_id": str(session_id)
+                })
 
             except Exception as e:
-                logger.error(f"Chat error: {e}", exc_info=True)
-                yield {
-                    "event": "error",
-                    "data": json.dumps({"error": str(e)}),
-                }
-
-        return EventSourceResponse(
-            event_generator(),
+                logger.error("Chat error: %s", e, exc_info=settings.debug)
+                yield _sse_frame(_EVENT_ERROR, {"error": str(e)})
+
+        return StreamingResponse(
+            with_keepalive(event_generator()),
             media_type="text/event-stream",
+            headers=SSE_HEADERS,
         )
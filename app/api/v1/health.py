@@ -1,5 +1,6 @@
 """Health check endpoints"""
 
+import asyncio
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -8,6 +9,7 @@ from app.db.session import get_session
 from app.schemas.common import HealthResponse
 from app.utils.time import utc_now
 from app.core.config import settings
+from app.llm.groq_client import get_groq_client
 
 router = APIRouter(tags=["Health"])
 
@@ -23,22 +25,22 @@ async def health_check(
     - Database
     - Groq API Client configuration
     """
-    db_status = "ok"
-    groq_status = "ok"
-
-    # Check database connectivity
-    try:
+    async def _check_db() -> str:
+        """Check database connectivity."""
         await session.execute(text("SELECT 1"))
-    except Exception:
-        db_status = "error"
-
-    # Check Groq API configuration/client availability
-    try:
-        from app.llm.groq_client import get_groq_client
-        if not get_groq_client().client:
-            groq_status = "error"
-    except Exception:
-        groq_status = "error"
+        return "ok"
+
+    async def _check_groq() -> str:
+        """Check Groq API configuration/client availability."""
+        return "ok" if get_groq_client().client else "error"
+
+    # Run both checks concurrently; any exception maps to "error"
+    db_status, groq_status = [
+        "error" if isinstance(result, BaseException) else result
+        for result in await asyncio.gather(
+            _check_db(), _check_groq(), return_exceptions=True
+        )
+    ]
 
     is_healthy = db_status == "ok" and groq_status == "ok"
     
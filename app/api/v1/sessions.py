@@ -2,9 +2,8 @@
 
 from uuid import UUID
 from fastapi import APIRouter, Depends, status, Path
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_session
+from app.api.deps import get_context_service, get_session_service
 from app.services.session_service import SessionService
 from app.services.context_service import ContextService
 from app.schemas.session import SessionResponse, SessionCreate
@@ -19,10 +18,9 @@ router = APIRouter(prefix="/sessions", tags=["Sessions"])
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session_details(
     session_id: UUID = Path(..., title="Session ID", description="The unique identifier of the session"),
-    session: AsyncSession = Depends(get_session),
+    service: SessionService = Depends(get_session_service),
 ) -> SessionResponse:
     """Get session details."""
-    service = SessionService(session)
     chat_session = await service.get_session(session_id)
 
     return SessionResponse(
@@ -39,12 +37,10 @@ async def get_session_details(
 @router.get("/{session_id}/messages", response_model=MessagesResponse)
 async def get_session_messages(
     session_id: UUID = Path(..., title="Session ID", description="The unique identifier of the session to fetch messages for"),
-    session: AsyncSession = Depends(get_session),
+    session_service: SessionService = Depends(get_session_service),
+    context_service: ContextService = Depends(get_context_service),
 ) -> MessagesResponse:
     """Get all messages for a session."""
-    session_service = SessionService(session)
-    context_service = ContextService(session)
-
     chat_session = await session_service.get_session(session_id)
     messages = await context_service.get_session_messages(session_id)
 
@@ -66,9 +62,8 @@ async def get_session_messages(
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_session(
     session_id: UUID = Path(..., title="Session ID", description="The unique identifier of the session to delete"),
-    session: AsyncSession = Depends(get_session),
+    service: SessionService = Depends(get_session_service),
 ) -> None:
     """Delete a session."""
-    service = SessionService(session)
     await service.delete_session(session_id)
     return None
@@ -1,9 +1,8 @@
 """User-related endpoints"""
 
 from fastapi import APIRouter, Depends, status, Response, Query, Path
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_session
+from app.api.deps import get_session_service, get_user_service
 from app.services.session_service import SessionService
 from app.services.user_service import UserService
 from app.schemas.user import (
@@ -21,17 +20,16 @@ router = APIRouter(prefix="/users", tags=["Users"])
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     request: UserCreate,
-    session: AsyncSession = Depends(get_session),
+    service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Create a new user."""
-    service = UserService(session)
     user = await service.create_user(
         request.user_id,
         request.name,
         request.city,
     )
 
-    return UserResponse(
+    return UserResponse.model_construct(
         user_id=user.user_id,
         name=user.name,
         city=user.city,
@@ -43,13 +41,12 @@ async def create_user(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str = Path(..., title="User ID", description="The unique identifier of the user"),
-    session: AsyncSession = Depends(get_session),
+    service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Get a single user by ID."""
-    service = UserService(session)
     user = await service.get_user(user_id)
 
-    return UserResponse(
+    return UserResponse.model_construct(
         user_id=user.user_id,
         name=user.name,
         city=user.city,
@@ -62,17 +59,16 @@ async def get_user(
 async def update_user(
     request: UserUpdate,
     user_id: str = Path(..., title="User ID", description="The unique identifier of the user to update"),
-    session: AsyncSession = Depends(get_session),
+    service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Update a user's profile."""
-    service = UserService(session)
     user = await service.update_user(
         user_id,
         request.name,
         request.city,
     )
 
-    return UserResponse(
+    return UserResponse.model_construct(
         user_id=user.user_id,
         name=user.name,
         city=user.city,
@@ -84,10 +80,9 @@ async def update_user(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: str = Path(..., title="User ID", description="The unique identifier of the user to delete"),
-    session: AsyncSession = Depends(get_session),
+    service: UserService = Depends(get_user_service),
 ) -> Response:
     """Delete a user and all their sessions."""
-    service = UserService(session)
     await service.delete_user(user_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -96,10 +91,9 @@ async def delete_user(
 async def get_users_with_sessions(
     limit: int = Query(50, ge=1, le=100, description="Max number of users to return"),
     offset: int = Query(0, ge=0, description="Number of users to skip"),
-    session: AsyncSession = Depends(get_session),
+    service: UserService = Depends(get_user_service),
 ) -> list[UserWithSessions]:
     """Get all users with their active sessions."""
-    service = UserService(session)
     return await service.get_users_with_sessions(limit, offset)
 
 
@@ -109,10 +103,9 @@ async def get_user_sessions(
     limit: int = Query(50, ge=1, le=100, description="Max number of sessions to return"),
     offset: int = Query(0, ge=0, description="Number of sessions to skip"),
     min_messages: int = Query(1, ge=0, description="Minimum messages required to include a session"),
-    session: AsyncSession = Depends(get_session),
+    service: SessionService = Depends(get_session_service),
 ) -> UserSessionsResponse:
     """Get all sessions for a user."""
-    service = SessionService(session)
     sessions = await service.get_user_sessions(
         user_id=user_id, 
         limit=limit, 
@@ -120,10 +113,11 @@ async def get_user_sessions(
         min_messages=min_messages
     )
 
+    # Rows come from the DB and are already typed, so skip re-validation
     return UserSessionsResponse(
         user_id=user_id,
         sessions=[
-            UserSessionSummary(
+            UserSessionSummary.model_construct(
                 id=s.id,
                 created_at=s.created_at,
                 status=s.status,
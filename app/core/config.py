@@ -1,7 +1,7 @@
 """Application configuration using Pydantic Settings"""
 
-from functools import lru_cache
-from pydantic import field_validator
+from functools import cached_property, lru_cache
+from pydantic import computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     app_name: str = "CheziousBot"
     app_version: str = "1.0.0"
     debug: bool = False
+    uvicorn_workers: int = 1
 
     # Groq API Configuration
     groq_api_key: str
@@ -37,16 +38,33 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./cheziousbot.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+
+    @computed_field
+    @cached_property
+    def is_sqlite(self) -> bool:
+        """Whether the configured database is SQLite."""
+        return self.database_url.startswith("sqlite")
+
+    # User profile cache (per process)
+    user_cache_size: int = 10_000
+    user_cache_ttl_seconds: int = 60
 
     # Context Management
     context_window_size: int = 10
     max_message_length: int = 500
 
+    # SSE token batching (0 ms sends every token as its own frame)
+    sse_batch_max_ms: int = 10
+    sse_batch_max_chars: int = 512
+
     # Rate Limiting
     rate_limit_per_minute: int = 20
 
     # Logging
     log_level: str = "INFO"
+    log_timestamp_microseconds: bool = True
 
     # CORS
     allowed_origins: list[str] = [
@@ -1,44 +1,124 @@
 """Structured JSON logging for CheziousBot"""
 
+import copy
 import logging
-import json
+import queue
 import sys
-import os
-from datetime import datetime, timezone
+import time
+from pathlib import Path
 from typing import Any
-from logging.handlers import RotatingFileHandler
-from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from contextvars import ContextVar, Token
+
+import orjson
 
 from app.core.config import settings
 
-# Context variables for request tracking
-request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
-session_id_var: ContextVar[str | None] = ContextVar("session_id", default=None)
-user_id_var: ContextVar[str | None] = ContextVar("user_id", default=None)
+# Context variable for request tracking: (request_id, session_id, user_id)
+# Packed into one variable so each record needs a single lookup.
+LogContextValue = tuple[str | None, str | None, str | None]
+log_context_var: ContextVar[LogContextValue] = ContextVar(
+    "log_context", default=(None, None, None)
+)
+
+# Queue front-ends installed by setup_logging (each owns its listener)
+_queue_handlers: list["LogQueueHandler"] = []
 
 
+class ContextFilter(logging.Filter):
+    """
+    Copy request context variables onto the record.
+
+    Runs on the emitting thread, since context variables are not visible
+    to the background listener thread that formats the record.
+    """
 
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id, record.session_id, record.user_id = log_context_var.get()
+        return True
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Queue handler for in-process listeners.
+
+    Unlike the stdlib default, the record is not pre-formatted and keeps its
+    exc_info, so traceback formatting happens on the listener thread.
+
+    While its listener is stopped, records are passed straight to the
+    listener's handlers instead, so nothing piles up in an unread queue.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, listener: QueueListener):
+        super().__init__(log_queue)
+        self.listener = listener
+        self.queued = False
+
+    def start(self) -> None:
+        """Start the listener and route records through the queue."""
+        if not self.queued:
+            self.listener.start()
+            with self.lock:
+                self.queued = True
+
+    def stop(self) -> None:
+        """Fall back to direct dispatch, then drain the queue and stop the listener."""
+        if self.queued:
+            # Taking the handler lock waits out any in-flight enqueue
+            with self.lock:
+                self.queued = False
+            self.listener.stop()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.queued:
+            super().emit(record)
+        else:
+            self.listener.handle(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # Merge args now; they may be mutated before the listener runs
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted ISO prefix) - reused for every record in that second
+        self._ts_cache: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Format a record timestamp as ISO 8601 UTC, caching the per-second prefix."""
+        second = int(created)
+        cached_second, prefix = self._ts_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._ts_cache = (second, prefix)
+
+        if settings.log_timestamp_microseconds:
+            return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+        return f"{prefix}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # Add context variables if present
-        if request_id := request_id_var.get():
+        # Add context (stamped by ContextFilter) if present
+        if request_id := getattr(record, "request_id", None):
             log_data["request_id"] = request_id
 
-        if session_id := session_id_var.get():
+        if session_id := getattr(record, "session_id", None):
             log_data["session_id"] = session_id
 
-        if user_id := user_id_var.get():
+        if user_id := getattr(record, "user_id", None):
             log_data["user_id"] = user_id
 
         # Add extra fields from record
@@ -46,29 +126,56 @@ class JSONFormatter(logging.Formatter):
             log_data.update(record.extra)
 
         # Add exception info if present
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_data["exception"] = record.exc_text
+
+        return orjson.dumps(
+            log_data, option=orjson.OPT_UTC_Z, default=str
+        ).decode()
+
+
+def _queued(*handlers: logging.Handler) -> LogQueueHandler:
+    """Route records through a queue to `handlers` on a background thread."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
 
-        return json.dumps(log_data)
+    queue_handler = LogQueueHandler(log_queue, listener)
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.start()
+    _queue_handlers.append(queue_handler)
+    return queue_handler
 
 
 def setup_logging() -> None:
-    """Configure structured logging."""
+    """
+    Configure structured logging.
+
+    Loggers only enqueue records; file and console I/O run on background
+    listener threads so they never block the event loop.
+    """
+    # Replace any previous configuration, releasing its handlers
+    shutdown_logging()
+    while _queue_handlers:
+        for handler in _queue_handlers.pop().listener.handlers:
+            handler.close()
+
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.log_level)
 
     
     # 1. File Handler (JSON) - Captures EVERYTHING
     # Ensure logs directory exists
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
         
     file_handler = RotatingFileHandler(
-        filename=f"{log_dir}/app.log",
+        filename=log_dir / "app.log",
         maxBytes=5 * 1024 * 1024,  # 5 MB
         backupCount=1,
-        encoding="utf-8"
+        encoding="utf-8",
+        delay=True,  # Open the file on first write
     )
     file_handler.setFormatter(JSONFormatter())
     
@@ -76,9 +183,13 @@ def setup_logging() -> None:
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_formatter = logging.Formatter("%(levelname)s:     %(name)s - %(message)s")
     stream_handler.setFormatter(stream_formatter)
+
+    # Queue front-ends for the blocking handlers
+    file_queue_handler = _queued(file_handler)
+    stream_queue_handler = _queued(stream_handler)
     
     # Configure Root Logger
-    root_logger.handlers = [file_handler, stream_handler]
+    root_logger.handlers = [file_queue_handler, stream_queue_handler]
 
     # 3. Attach File Handler to external loggers
     
@@ -86,7 +197,8 @@ def setup_logging() -> None:
     # We do NOT remove existing handlers (so Uvicorn keeps its console output)
     for logger_name in ["uvicorn", "uvicorn.error", "uvicorn.access", "fastapi"]:
         log = logging.getLogger(logger_name)
-        log.addHandler(file_handler)
+        log.handlers = [h for h in log.handlers if not isinstance(h, LogQueueHandler)]
+        log.addHandler(file_queue_handler)
         log.propagate = False
         
     # Group B: Silence Console + Add File (Database, Migrations)
@@ -94,13 +206,30 @@ def setup_logging() -> None:
     for logger_name in ["sqlalchemy.engine", "alembic"]:
         log = logging.getLogger(logger_name)
         log.handlers = []
-        log.addHandler(file_handler)
+        log.addHandler(file_queue_handler)
         log.propagate = False
 
     # Silence noisy ones if needed
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
+def start_logging() -> None:
+    """(Re)start background log listeners stopped by `shutdown_logging`."""
+    for queue_handler in _queue_handlers:
+        queue_handler.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Stop background log listeners, flushing any queued records.
+
+    Later records are written synchronously until `start_logging` is called;
+    handlers themselves are closed by `logging.shutdown` at interpreter exit.
+    """
+    for queue_handler in _queue_handlers:
+        queue_handler.stop()
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance."""
     return logging.getLogger(name)
@@ -120,17 +249,19 @@ class LogContext:
         self.request_id = request_id
         self.session_id = session_id
         self.user_id = user_id
-        self._tokens: list = []
+        self._token: Token[LogContextValue] | None = None
 
     def __enter__(self):
-        if self.request_id:
-            self._tokens.append(request_id_var.set(self.request_id))
-        if self.session_id:
-            self._tokens.append(session_id_var.set(self.session_id))
-        if self.user_id:
-            self._tokens.append(user_id_var.set(self.user_id))
+        # Unset fields inherit the enclosing context
+        request_id, session_id, user_id = log_context_var.get()
+        self._token = log_context_var.set((
+            self.request_id or request_id,
+            self.session_id or session_id,
+            self.user_id or user_id,
+        ))
         return self
 
     def __exit__(self, *args):
-        for token in reversed(self._tokens):
-            token.var.reset(token)
+        if self._token is not None:
+            log_context_var.reset(self._token)
+            self._token = None
@@ -1,65 +1,117 @@
 """Resilience and logging middleware."""
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response, JSONResponse
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.logging import get_logger
+from app.core.logging import get_logger, LogContext
+from app.utils.ids import generate_request_id
 
 logger = get_logger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+# Both middlewares are plain ASGI rather than BaseHTTPMiddleware, which wraps
+# `receive` and hides client disconnects from streaming endpoints.
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    """Return a request header value from the ASGI scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class RequestLoggingMiddleware:
     """Middleware to log request duration and status."""
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and log its details."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # The log context is inherited by the endpoint and everything it calls,
+        # so downstream logs carry the request ID without it being passed around
+        with LogContext(
+            request_id=generate_request_id(),
+            user_id=_header(scope, b"x-user-id"),
+        ):
+            await self._dispatch(scope, receive, send)
+
+    async def _dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
         start_time = time.perf_counter()
-        
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration in milliseconds
+                duration = (time.perf_counter() - start_time) * 1000
+
+                logger.info(
+                    "%s %s -> %d (%.0fms)",
+                    scope["method"], scope["path"], message["status"], duration,
+                )
+            await send(message)
+
         try:
-            response = await call_next(request)
-            
-            # Calculate duration in milliseconds
-            duration = (time.perf_counter() - start_time) * 1000
-            
-            logger.info(
-                f"{request.method} {request.url.path} -> {response.status_code} ({duration:.0f}ms)"
-            )
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
+
         except Exception as e:
             # Calculate duration even for failed requests
             duration = (time.perf_counter() - start_time) * 1000
             logger.error(
-                f"{request.method} {request.url.path} -> CRASHED ({duration:.0f}ms): {e}",
+                "%s %s -> CRASHED (%.0fms): %s",
+                scope["method"], scope["path"], duration, e,
                 exc_info=True
             )
-            # Re-raise to let the general exception handler handle it, 
+            # Re-raise to let the general exception handler handle it,
             # or it will be caught by ResilienceMiddleware if that's next in the stack.
             raise
 
 
-class ResilienceMiddleware(BaseHTTPMiddleware):
+class ResilienceMiddleware:
     """
-    Ultimate safety net middleware. 
+    Ultimate safety net middleware.
     Catches any exception that escaped earlier handlers and returns a clean 500 JSON.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             logger.error(
-                f"Unhandled Exception caught by ResilienceMiddleware: {str(e)}", 
+                "Unhandled Exception caught by ResilienceMiddleware: %s", e,
                 exc_info=True
             )
-            return JSONResponse(
+            # A streamed response is already underway; it can only be aborted
+            if response_started:
+                raise
+
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "error": {
                         "code": "INTERNAL_SERVER_ERROR",
                         "message": "A critical system error occurred. Our team has been notified.",
-                        "details": {"type": type(e).__name__} if request.app.debug else {}
+                        "details": {"type": type(e).__name__} if scope["app"].debug else {}
                     }
                 }
             )
+            await response(scope, receive, send)
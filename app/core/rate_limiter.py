@@ -1,12 +1,38 @@
 """Rate limiting middleware using SlowAPI"""
 
+import secrets
+
+from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.core.config import settings
 
+
+def _has_valid_api_key(request: Request) -> bool:
+    """Whether the request carries the configured API key."""
+    if not settings.api_key_enabled or not settings.api_key:
+        return False
+    api_key = request.headers.get("x-api-key", "")
+    return secrets.compare_digest(api_key.encode(), settings.api_key.encode())
+
+
+def get_rate_limit_key(request: Request) -> str:
+    """
+    Key requests by client address.
+
+    X-User-ID is unauthenticated, so it is only trusted (letting clients
+    behind one address get separate limits) when a valid API key is sent.
+    """
+    user_id = request.headers.get("x-user-id")
+    if user_id and _has_valid_api_key(request):
+        return f"user:{user_id}"
+    return get_remote_address(request)
+
+
 # Create limiter instance
-limiter = Limiter(key_func=get_remote_address)
+# Moving window avoids the burst allowed at fixed-window boundaries.
+limiter = Limiter(key_func=get_rate_limit_key, strategy="moving-window")
 
 
 def get_rate_limit_string() -> str:
@@ -2,6 +2,7 @@
 
 import time
 import asyncio
+import logging
 from typing import AsyncGenerator
 from groq import AsyncGroq, RateLimitError, APIStatusError, APIConnectionError
 from tenacity import (
@@ -75,33 +76,38 @@ class GroqClient:
                     # Track first token latency
                     if first_token_time is None:
                         first_token_time = time.perf_counter()
-                        latency = (first_token_time - start_time) * 1000
-                        logger.info(
-                            f"First token latency: {latency:.0f}ms",
-                            extra={"first_token_latency_ms": latency},
-                        )
+                        if logger.isEnabledFor(logging.INFO):
+                            latency = (first_token_time - start_time) * 1000
+                            logger.info(
+                                "First token latency: %.0fms",
+                                latency,
+                                extra={"first_token_latency_ms": latency},
+                            )
 
                     total_tokens += 1
                     yield token
 
-            # Log completion stats
-            total_time = (time.perf_counter() - start_time) * 1000
-            logger.info(
-                f"Stream complete: {total_tokens} tokens in {total_time:.0f}ms",
-                extra={
-                    "total_tokens": total_tokens,
-                    "total_time_ms": total_time,
-                },
-            )
+            # Log completion stats (skip building `extra` when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                total_time = (time.perf_counter() - start_time) * 1000
+                logger.info(
+                    "Stream complete: %d tokens in %.0fms",
+                    total_tokens,
+                    total_time,
+                    extra={
+                        "total_tokens": total_tokens,
+                        "total_time_ms": total_time,
+                    },
+                )
 
         except (RateLimitError, APIStatusError, APIConnectionError) as e:
-            logger.error(f"Groq API persistent error: {e}", exc_info=True)
+            logger.error("Groq API persistent error: %s", e, exc_info=True)
             raise GroqAPIException(
                 message=f"Groq service is currently unavailable or overloaded: {str(e)}",
                 details={"model": self.model, "error_type": type(e).__name__},
             )
         except Exception as e:
-            logger.error(f"Unexpected Groq client error: {e}", exc_info=True)
+            logger.error("Unexpected Groq client error: %s", e, exc_info=True)
             raise GroqAPIException(
                 message=f"An unexpected error occurred while communicating with Groq: {str(e)}",
                 details={"model": self.model},
@@ -1,5 +1,7 @@
 """System prompts for CheziousBot"""
 
+from functools import lru_cache
+
 # ============================================================================
 # COMPONENT DEFINITIONS
 # ============================================================================
@@ -110,54 +112,69 @@ Saddar, Commercial Market, Chandni Chowk, Adyala Road, Kalma Chowk, Scheme 3, Wa
 Peshawar (Gulbahar, University Rd, HBK), Kasur, Mardan, Sahiwal, Mian Channu, Pattoki, Okara.
 """
 
+CRITICAL_REMINDER_PROMPT = """
+## CRITICAL REMINDER
+- ⚠️ **DO NOT DUMP THE MENU**. If asked for "menu", provide specific categories ONLY.
+- ⚠️ **DO NOT HALLUCINATE**. Use the "KNOWLEDGE BASE" above for prices.
+- ⚠️ **KEEP IT CONCISE**. Short answers are better.
+"""
+
 # ============================================================================
 # PROMPT COMPOSITION LOGIC
 # ============================================================================
 
+# Static sections never change at runtime, so they are assembled once at import.
+
+# 2. Knowledge Base (What you know)
+# We label this clearly so the LLM knows this is reference data, not necessarily immediate output.
+_KNOWLEDGE_BASE_PROMPT = "\n\n".join([
+    "## KNOWLEDGE BASE (REFERENCE ONLY)",
+    BUSINESS_INFO_PROMPT,
+    MENU_DATA_PROMPT,
+    BRANCH_LOCATIONS_PROMPT,
+])
+
+_BASE_PROMPT = "\n\n".join([
+    # 1. Identity & Persona (Who you are)
+    IDENTITY_PROMPT,
+    _KNOWLEDGE_BASE_PROMPT,
+    # 3. Operational Rules (How you behave)
+    # Placed AFTER data to override any tendency to dump data.
+    INTERACTION_GUIDELINES,
+])
+
+# 5. Final Command (Strict Override) - always the last section
+_DEFAULT_PROMPT = _BASE_PROMPT + "\n\n" + CRITICAL_REMINDER_PROMPT
+
+
+@lru_cache(maxsize=512)
 def get_system_prompt(user_name: str | None = None, location: str | None = None) -> str:
     """
     Constructs the final system prompt dynamically based on context.
     
+    Only the user context block varies per call; results are cached per
+    (user_name, location) pair.
+    
     Args:
         user_name: Optional user name for personalization.
         location: Optional user city for location-aware answers.
     """
-    
-    # 1. Identity & Persona (Who you are)
-    prompt_parts = [IDENTITY_PROMPT]
-    
-    # 2. Knowledge Base (What you know)
-    # We label this clearly so the LLM knows this is reference data, not necessarily immediate output.
-    prompt_parts.append("## KNOWLEDGE BASE (REFERENCE ONLY)\n\n" + "\n\n".join([
-        BUSINESS_INFO_PROMPT,
-        MENU_DATA_PROMPT,
-        BRANCH_LOCATIONS_PROMPT
-    ]))
-
-    # 3. Operational Rules (How you behave)
-    # Placed AFTER data to override any tendency to dump data.
-    prompt_parts.append(INTERACTION_GUIDELINES)
+    if not user_name and not location:
+        return _DEFAULT_PROMPT
 
     # 4. Dynamic User Context (Who you are talking to)
-    context_instructions = []
+    context_lines = ["## CURRENT CONTEXT"]
     if user_name:
-        context_instructions.append(f"- **User Name**: {user_name} (Address them warmly).")
+        context_lines.append(f"- **User Name**: {user_name} (Address them warmly).")
     
     if location:
-        context_instructions.append(f"- **User Location**: {location}.")
-        context_instructions.append(f"  - **Instruction**: Prioritize {location} branches.")
-        context_instructions.append(f"  - **Instruction**: If they ask for 'branches', list {location} ones first.")
-
-    if context_instructions:
-        prompt_parts.append("## CURRENT CONTEXT\n" + "\n".join(context_instructions))
-
-    # 5. Final Command (Strict Override)
-    prompt_parts.append("""
-## CRITICAL REMINDER
-- ⚠️ **DO NOT DUMP THE MENU**. If asked for "menu", provide specific categories ONLY.
-- ⚠️ **DO NOT HALLUCINATE**. Use the "KNOWLEDGE BASE" above for prices.
-- ⚠️ **KEEP IT CONCISE**. Short answers are better.
-""")
+        context_lines.append(f"- **User Location**: {location}.")
+        context_lines.append(f"  - **Instruction**: Prioritize {location} branches.")
+        context_lines.append(f"  - **Instruction**: If they ask for 'branches', list {location} ones first.")
 
     # 6. Final Assembly
-    return "\n\n".join(prompt_parts)
+    return "\n\n".join([
+        _BASE_PROMPT,
+        "\n".join(context_lines),
+        CRITICAL_REMINDER_PROMPT,
+    ])
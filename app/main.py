@@ -5,17 +5,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
-from app.core.logging import setup_logging, get_logger
+from app.core.logging import setup_logging, start_logging, shutdown_logging, get_logger
 from app.core.exceptions import ChatBotException
 from app.core.rate_limiter import limiter
 from app.core.middleware import RequestLoggingMiddleware, ResilienceMiddleware
 from app.db.engine import init_db, close_db
 from app.api import v1_router
+from app.utils.responses import ORJSONResponse
 
 # Initialize Logging
 setup_logging()
@@ -25,7 +25,9 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events (startup & shutdown)."""
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
+    # Resume queued logging if a previous lifespan shut it down
+    start_logging()
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
     
     # Startup
     await init_db()
@@ -36,6 +38,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     await close_db()
     logger.info("Application shutdown complete")
+    shutdown_logging()
 
 
 # Create FastAPI app
@@ -54,8 +57,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let preflights be answered without echoing request headers
+    allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-User-ID", "X-API-Key"],
+    max_age=86400,  # Browsers may cache preflight results for a day
 )
 app.add_middleware(ResilienceMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
@@ -66,29 +71,29 @@ app.include_router(v1_router)
 # 3. Exception Handlers
 @app.exception_handler(ChatBotException)
 async def chatbot_exception_handler(request: Request, exc: ChatBotException):
-    logger.warning(f"ChatBotException: {exc.code} - {exc.message}")
-    return JSONResponse(
+    logger.warning("ChatBotException: %s - %s", exc.code, exc.message)
+    return ORJSONResponse(
         status_code=exc.status_code,  # Simplified: Use property if available or default
         content=exc.to_dict()
     )
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": {"code": "HTTP_ERROR", "message": exc.detail}}
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unexpected error: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={"error": {"code": "INTERNAL_ERROR", "message": "An unexpected error occurred"}}
     )
 
 
-@app.get("/")
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     """Root endpoint for API status."""
     return {
@@ -100,6 +105,17 @@ async def root():
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=settings.debug)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=settings.debug,
+        # uvloop has no Windows build; fall back to the stdlib asyncio loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Reload mode only supports a single process
+        workers=None if settings.debug else settings.uvicorn_workers,
+    )
 
@@ -4,6 +4,7 @@ from datetime import datetime
 from uuid import UUID, uuid4
 from enum import Enum
 from typing import TYPE_CHECKING
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
@@ -101,3 +102,12 @@ class ChatSession(SQLModel, table=True):
         """Returns True if the session is in 'active' state and not expired."""
         return self.status == SessionStatus.ACTIVE and not self.is_expired
 
+
+# Serves a user's active sessions newest-first (get_user_sessions)
+Index(
+    "ix_sessions_user_created_active",
+    ChatSession.user_id,
+    ChatSession.created_at.desc(),
+    postgresql_where=text("status = 'ACTIVE'"),
+    sqlite_where=text("status = 'ACTIVE'"),
+)
@@ -60,7 +60,10 @@ class User(SQLModel, table=True):
     # Relationships
     sessions: list["ChatSession"] = Relationship(
         back_populates="user",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "order_by": "ChatSession.created_at.desc()",
+        }
     )
 
     def increment_session_count(self) -> None:
@@ -0,0 +1,83 @@
+"""Per-process TTL cache of user profile fields"""
+
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+# (name, city) as stored on the User row
+UserProfile = tuple[str | None, str | None]
+
+# Profiles change rarely, so a short TTL bounds staleness across workers while
+# sparing a SELECT on every chat turn. All access is synchronous (no awaits
+# between read and write), so no lock is needed on the event loop.
+_cache: TTLCache[str, UserProfile] = TTLCache(
+    maxsize=settings.user_cache_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
+
+# Bumped by every committed invalidation; a fill read under an older
+# generation may carry pre-update data and is dropped
+_generation = 0
+
+# Key in Session.info holding changes staged until the transaction commits:
+# user_id -> (profile or None to invalidate, generation or None if authoritative)
+_PENDING_KEY = "user_cache_pending"
+
+
+def get_profile(user_id: str) -> UserProfile | None:
+    """Return the cached profile for a user, or None on a miss."""
+    return _cache.get(user_id)
+
+
+def generation() -> int:
+    """Current invalidation generation; capture it before reading a user row."""
+    return _generation
+
+
+def stage_profile(
+    db: AsyncSession,
+    user_id: str,
+    name: str | None,
+    city: str | None,
+    read_generation: int | None = None,
+) -> None:
+    """
+    Cache a user's profile once `db` commits.
+
+    Pass `read_generation` for values that were merely read, so they are
+    discarded if the user was invalidated in the meantime. Values written by
+    this transaction itself omit it.
+    """
+    pending = _pending(db)
+    staged = pending.get(user_id)
+    if staged is not None and staged[0] is None:
+        return  # Invalidated in this transaction; a later read refills it
+    pending[user_id] = ((name, city), read_generation)
+
+
+def stage_invalidate(db: AsyncSession, user_id: str) -> None:
+    """Drop a user's cached profile once `db` commits."""
+    _pending(db)[user_id] = (None, None)
+
+
+def _pending(db: AsyncSession) -> dict[str, tuple[UserProfile | None, int | None]]:
+    return db.info.setdefault(_PENDING_KEY, {})
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    global _generation
+    for user_id, (profile, read_generation) in session.info.pop(_PENDING_KEY, {}).items():
+        if profile is None:
+            _cache.pop(user_id, None)
+            _generation += 1
+        elif read_generation is None or read_generation == _generation:
+            _cache[user_id] = profile
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
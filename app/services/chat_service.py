@@ -1,5 +1,6 @@
 """Chat service for orchestrating chat interactions"""
 
+import logging
 from uuid import UUID
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,9 +8,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.core.exceptions import ValidationException, SessionNotFoundException, UserNotFoundException
 from app.core.logging import get_logger
+from app.db.engine import async_session
 from app.services.session_service import SessionService
 from app.services.context_service import ContextService
-from app.services.user_service import UserService
 from app.llm.groq_client import get_groq_client
 
 logger = get_logger(__name__)
@@ -18,11 +19,14 @@ logger = get_logger(__name__)
 class ChatService:
     """Service for chat orchestration."""
 
+    __slots__ = ("db", "session_service", "context_service", "user_service")
+
     def __init__(self, db: AsyncSession):
         self.db = db
         self.session_service = SessionService(db)
         self.context_service = ContextService(db)
-        self.user_service = UserService(db)
+        # Share the session service's UserService instead of building another
+        self.user_service = self.session_service.user_service
 
     def validate_message(self, content: str) -> str:
         """
@@ -67,15 +71,15 @@ class ChatService:
                 # Check ownership if user_id is provided
                 if user_id and existing_session.user_id != user_id:
                     logger.warning(
-                        f"Session {session_id} belongs to user {existing_session.user_id}, "
-                        f"not {user_id}. Creating new session."
+                        "Session %s belongs to user %s, not %s. Creating new session.",
+                        session_id, existing_session.user_id, user_id,
                     )
                     session_id = None
                 else:
-                    logger.info(f"Resuming existing session {session_id}")
+                    logger.info("Resuming existing session %s", session_id)
                     return session_id
             except SessionNotFoundException:
-                logger.warning(f"Provided session {session_id} not found. Creating new session.")
+                logger.warning("Provided session %s not found. Creating new session.", session_id)
                 session_id = None
 
         # Create new session if execution reaches here
@@ -83,22 +87,28 @@ class ChatService:
             raise ValidationException("user_id is required to create a new session")
         
         new_session = await self.session_service.create_session(user_id=user_id)
-        logger.info(f"Auto-created session {new_session.id} for user {user_id}")
+        logger.info("Auto-created session %s for user %s", new_session.id, user_id)
         return new_session.id
 
-    async def handle_chat(
+    async def prepare_chat(
         self,
         user_message: str,
-        session_id: UUID,  # Now expects a valid, resolved ID
+        session_id: UUID,  # Expects a valid, resolved ID
         user_id: str | None = None,
-    ) -> AsyncGenerator[str, None]:
+    ) -> list[dict[str, str]]:
         """
-        Handle a chat request with streaming response.
-        Assumes session_id is valid and exists (resolved via resolve_session).
+        Persist the user's message and build the LLM messages for this turn.
+
+        All database work for the turn happens here. It is committed and the
+        session's connection released before returning, so no connection is
+        held while the reply streams.
+
+        Returns:
+            Messages for the LLM API call
         """
         # 1. Validate input
         user_message = self.validate_message(user_message)
-        logger.info(f"Processing chat for session {session_id}")
+        logger.info("Processing chat for session %s", session_id)
         
         # 2. Re-verify session exists (should be cached/fast)
         try:
@@ -107,9 +117,7 @@ class ChatService:
             # Should not happen if resolve_session was called, but safety net:
              raise ValidationException("Session not found after resolution")
              
-        logger.debug(f"Session verified: {chat_session.id}")
-        
-        # 3. Save user message...
+        logger.debug("Session verified: %s", chat_session.id)
 
         # 3. Save user message
         await self.context_service.save_message(
@@ -126,47 +134,79 @@ class ChatService:
             current_user_id = user_id or chat_session.user_id
             if current_user_id:
                 try:
-                    user = await self.user_service.get_user(current_user_id)
-                    user_name = user_name or user.name
-                    location = location or user.city
+                    name, city = await self.user_service.get_user_profile(current_user_id)
+                    user_name = user_name or name
+                    location = location or city
                 except UserNotFoundException:
-                    logger.debug(f"User {current_user_id} not found, proceeding without full context")
+                    logger.debug("User %s not found, proceeding without full context", current_user_id)
                 except Exception as e:
-                    logger.error(f"Unexpected error fetching user {current_user_id}: {e}")
-        
-        # 4. Commit the session NOW before streaming
-        await self.db.commit()
+                    logger.error("Unexpected error fetching user %s: %s", current_user_id, e)
 
-        # 5. Get context messages
+        # 4. Get context messages (same transaction, sees the flushed message)
         context_messages = await self.context_service.get_context_messages(
             session_id
         )
 
+        # 5. Commit and hand the connection back to the pool before streaming
+        await self.db.commit()
+        await self.db.close()
+
         # 6. Build LLM messages (without current message since it's in context)
-        llm_messages = self.context_service.build_messages_for_llm(
+        return self.context_service.build_messages_for_llm(
             context_messages[:-1],  # Exclude the just-saved message
             user_message,
             user_name=user_name,
             location=location,
         )
 
-        # 7. Stream response from Groq
+    async def stream_reply(
+        self,
+        session_id: UUID,
+        llm_messages: list[dict[str, str]],
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream the LLM reply, then save it.
+
+        The reply is saved through a short-lived session of its own, opened only
+        once streaming has finished.
+        """
+        # 1. Stream response from Groq
         full_response: list[str] = []
         async for token in get_groq_client().stream_chat(llm_messages):
             full_response.append(token)
             yield token
 
-        # 8. Save assistant response (session will be committed by dependency)
+        # 2. Save assistant response and bump the counter in one transaction
         assistant_content = "".join(full_response)
-        await self.context_service.save_message(
-            session_id, "assistant", assistant_content
-        )
-        await self.session_service.increment_message_count(session_id)
+        async with async_session() as db:
+            await ContextService(db).save_message(
+                session_id, "assistant", assistant_content
+            )
+            await SessionService(db).increment_message_count(session_id)
+            await db.commit()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Chat completed for session %s",
+                session_id,
+                extra={"response_length": len(assistant_content)},
+            )
 
-        logger.info(
-            f"Chat completed for session {session_id}",
-            extra={"response_length": len(assistant_content)},
-        )
+    async def handle_chat(
+        self,
+        user_message: str,
+        session_id: UUID,  # Now expects a valid, resolved ID
+        user_id: str | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Handle a chat request with streaming response.
+        Assumes session_id is valid and exists (resolved via resolve_session).
+
+        Equivalent to `prepare_chat` followed by `stream_reply`.
+        """
+        llm_messages = await self.prepare_chat(user_message, session_id, user_id)
+        async for token in self.stream_reply(session_id, llm_messages):
+            yield token
 
     async def get_response(
         self,
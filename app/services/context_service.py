@@ -16,6 +16,8 @@ logger = get_logger(__name__)
 class ContextService:
     """Service for managing conversation context."""
 
+    __slots__ = ("db", "max_messages")
+
     def __init__(
         self,
         db: AsyncSession,
@@ -50,11 +52,11 @@ class ContextService:
             messages.reverse()
 
             logger.debug(
-                f"Retrieved {len(messages)} context messages for session {session_id}"
+                "Retrieved %d context messages for session %s", len(messages), session_id
             )
             return messages
         except Exception as e:
-            logger.error(f"Failed to get context messages: {e}")
+            logger.error("Failed to get context messages: %s", e)
             raise DatabaseException(f"Failed to retrieve messages: {e}")
 
     def build_messages_for_llm(
@@ -93,8 +95,7 @@ class ContextService:
             "content": current_message,
         })
 
-        total_messages = len(llm_messages)
-        logger.debug(f"Built {total_messages} messages for LLM")
+        logger.debug("Built %d messages for LLM", len(llm_messages))
 
         return llm_messages
 
@@ -127,10 +128,10 @@ class ContextService:
             self.db.add(message)
             await self.db.flush()
 
-            logger.debug(f"Saved {role} message for session {session_id}")
+            logger.debug("Saved %s message for session %s", role, session_id)
             return message
         except Exception as e:
-            logger.error(f"Failed to save message: {e}")
+            logger.error("Failed to save message: %s", e)
             raise DatabaseException(f"Failed to save message: {e}")
 
     async def get_session_messages(self, session_id: UUID) -> list[Message]:
@@ -3,20 +3,40 @@
 from uuid import UUID
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import bindparam, literal, select, delete, update
 
+from app.models.message import Message
 from app.models.session import ChatSession, SessionStatus
 from app.models.user import User
 from app.core.exceptions import SessionNotFoundException, UserNotFoundException
 from app.core.logging import get_logger
+from app.utils.time import utc_now
 from app.services.user_service import UserService
 
 logger = get_logger(__name__)
 
+# Built once at import; values are supplied as bound parameters per call.
+# The status is rendered inline so the planner can match the partial index
+# ix_sessions_user_created_active even for cached/generic plans.
+_USER_SESSIONS_STMT = (
+    select(ChatSession)
+    .where(
+        ChatSession.user_id == bindparam("user_id"),
+        ChatSession.status
+        == literal(SessionStatus.ACTIVE, ChatSession.status.type, literal_execute=True),
+        ChatSession.message_count >= bindparam("min_messages"),
+    )
+    .order_by(ChatSession.created_at.desc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+
 
 class SessionService:
     """Service layer for chat session operations."""
 
+    __slots__ = ("db", "user_service")
+
     def __init__(self, db: AsyncSession):
         self.db = db
         self.user_service = UserService(db)
@@ -43,8 +63,9 @@ class SessionService:
         Returns:
             The created ChatSession persisted in the DB.
         """
-        # Ensure user exists and get their profile data
-        user = await self.user_service.get_or_create_user(user_id)
+        # Ensure user exists, bump their session count and get their profile
+        # data in a single round trip
+        user = await self.user_service.record_new_session(user_id)
         
         # Fallback to user profile if specific context isn't provided
         final_user_name = user_name or user.name
@@ -64,10 +85,7 @@ class SessionService:
         self.db.add(chat_session)
         await self.db.flush()
         
-        # Update user stats
-        await self.user_service.increment_session_count(user_id)
-        
-        logger.info(f"Session created: {chat_session.id} (User: {user_id})")
+        logger.info("Session created: %s (User: %s)", chat_session.id, user_id)
         return chat_session
 
     async def get_session(self, session_id: UUID) -> ChatSession:
@@ -97,20 +115,16 @@ class SessionService:
         Args:
             min_messages: Filter out empty sessions with fewer than N messages.
         """
-        stmt = (
-            select(ChatSession)
-            .where(
-                ChatSession.user_id == user_id,
-                ChatSession.status == SessionStatus.ACTIVE,
-                ChatSession.message_count >= min_messages
-            )
-            .order_by(ChatSession.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        result = await self.db.scalars(
+            _USER_SESSIONS_STMT,
+            {
+                "user_id": user_id,
+                "min_messages": min_messages,
+                "limit": limit,
+                "offset": offset,
+            },
         )
-        
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
 
     async def get_user_session(
         self, user_id: str, session_id: UUID
@@ -121,29 +135,47 @@ class SessionService:
         Raises:
             SessionNotFoundException: If session missing or belongs to another user.
         """
-        stmt = select(ChatSession).where(
-            ChatSession.id == session_id,
-            ChatSession.user_id == user_id
-        )
-        result = await self.db.execute(stmt)
-        chat_session = result.scalar_one_or_none()
+        # Primary-key lookup hits the identity map when the session was already
+        # loaded in this unit of work; ownership is then a cheap Python check
+        chat_session = await self.db.get(ChatSession, session_id)
 
-        if not chat_session:
+        if chat_session is None or chat_session.user_id != user_id:
             raise SessionNotFoundException(str(session_id))
 
         return chat_session
 
     async def delete_session(self, session_id: UUID) -> None:
         """
-        Delete a session.
+        Delete a session and its messages.
+
+        Issued as bare DELETEs without loading the session first. Foreign keys
+        carry no ON DELETE CASCADE, so messages are removed explicitly.
+
+        Raises:
+            SessionNotFoundException: If session does not exist.
         """
-        chat_session = await self.get_session(session_id)
-        await self.db.delete(chat_session)
-        await self.db.flush()
-        logger.info(f"Session deleted: {session_id}")
+        await self.db.execute(delete(Message).where(Message.session_id == session_id))
+        result = await self.db.execute(delete(ChatSession).where(ChatSession.id == session_id))
+        if result.rowcount == 0:
+            raise SessionNotFoundException(str(session_id))
+        logger.info("Session deleted: %s", session_id)
 
     async def increment_message_count(self, session_id: UUID) -> None:
-        """Atomic increment of message count for a session."""
-        chat_session = await self.get_session(session_id)
-        chat_session.increment_message_count()
-        await self.db.flush()
+        """
+        Atomic increment of message count for a session.
+
+        Issued as a bare UPDATE so the session row is never loaded.
+
+        Raises:
+            SessionNotFoundException: If session does not exist.
+        """
+        result = await self.db.execute(
+            update(ChatSession)
+            .where(ChatSession.id == session_id)
+            .values(
+                message_count=ChatSession.message_count + 1,
+                last_activity_at=utc_now(),
+            )
+        )
+        if result.rowcount == 0:
+            raise SessionNotFoundException(str(session_id))
@@ -3,20 +3,31 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
+from app.models.message import Message
 from app.models.user import User
 from app.models.session import ChatSession, SessionStatus
 from app.schemas.user import UserWithSessions, UserSessionSummary
 from app.core.exceptions import UserNotFoundException, UserAlreadyExistsException
 from app.core.logging import get_logger
+from app.services import _user_cache
+from app.utils.time import utc_now
 
 logger = get_logger(__name__)
 
+# Dialect-specific INSERT supporting ON CONFLICT ... RETURNING
+_insert = sqlite_insert if settings.is_sqlite else pg_insert
+
 
 class UserService:
     """Service layer for handling User domain logic."""
 
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -31,15 +42,19 @@ class UserService:
         Raises:
             UserAlreadyExistsException: If a user with the given ID already exists.
         """
-        if await self._user_exists(user_id):
+        # A single INSERT ... ON CONFLICT DO NOTHING replaces the separate
+        # existence check; no returned row means the user already exists.
+        stmt = (
+            self._insert_user_stmt(user_id, name, city)
+            .on_conflict_do_nothing(index_elements=[User.user_id])
+            .returning(User)
+        )
+        user = (await self.db.scalars(stmt)).first()
+        if user is None:
             raise UserAlreadyExistsException(user_id)
 
-        user = User(user_id=user_id, name=name, city=city)
-        self.db.add(user)
-        # We flush to get the ID/defaults but commit is handled by caller/middleware
-        await self.db.flush()
-        
-        logger.info(f"User created: {user_id}")
+        _user_cache.stage_profile(self.db, user_id, user.name, user.city)
+        logger.info("User created: %s", user_id)
         return user
 
     async def get_user(self, user_id: str) -> User:
@@ -49,11 +64,26 @@ class UserService:
         Raises:
             UserNotFoundException: If the user does not exist.
         """
+        read_generation = _user_cache.generation()
         user = await self.db.get(User, user_id)
         if not user:
             raise UserNotFoundException(user_id)
+        _user_cache.stage_profile(self.db, user_id, user.name, user.city, read_generation)
         return user
 
+    async def get_user_profile(self, user_id: str) -> _user_cache.UserProfile:
+        """
+        Retrieve a user's (name, city), served from the per-process cache when possible.
+
+        Raises:
+            UserNotFoundException: If the user does not exist.
+        """
+        profile = _user_cache.get_profile(user_id)
+        if profile is None:
+            user = await self.get_user(user_id)
+            profile = (user.name, user.city)
+        return profile
+
     async def update_user(
         self, user_id: str, name: Optional[str] = None, city: Optional[str] = None
     ) -> User:
@@ -70,52 +100,49 @@ class UserService:
             user.city = city
         
         await self.db.flush()
-        logger.info(f"User updated: {user_id}")
+        _user_cache.stage_invalidate(self.db, user_id)
+        logger.info("User updated: %s", user_id)
         return user
 
-    async def get_or_create_user(
-        self, user_id: str, name: Optional[str] = None, city: Optional[str] = None
-    ) -> User:
+    async def record_new_session(self, user_id: str) -> User:
         """
-        Retrieve an existing user, updating their profile if new info is provided,
-        OR create a new user if one does not exist.
-        
-        This is an idempotent operation safe for repeated calls.
-        """
-        user = await self.db.get(User, user_id)
+        Ensure the user exists and bump their session count in one statement.
 
-        if user:
-            # User exists, optionally update their details
-            updated = False
-            if name is not None and user.name != name:
-                user.name = name
-                updated = True
-            if city is not None and user.city != city:
-                user.city = city
-                updated = True
-            
-            if updated:
-                await self.db.flush()
-                logger.debug(f"User refreshed: {user_id}")
-            return user
-
-        # User does not exist, create new
-        return await self.create_user(user_id, name, city)
+        Inserts the user with a session count of 1, or increments the count of
+        an existing row, returning the up-to-date profile either way.
+        """
+        stmt = self._insert_user_stmt(user_id, session_count=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.user_id],
+            set_={
+                "session_count": User.session_count + 1,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(User)
+
+        result = await self.db.scalars(stmt, execution_options={"populate_existing": True})
+        user = result.one()
+        _user_cache.stage_profile(self.db, user_id, user.name, user.city)
+        return user
 
     async def delete_user(self, user_id: str) -> None:
         """
         Delete a user and cascadingly remove their sessions/messages.
-        """
-        user = await self.get_user(user_id)
-        await self.db.delete(user)
-        await self.db.flush()
-        logger.info(f"User deleted: {user_id}")
 
-    async def increment_session_count(self, user_id: str) -> None:
-        """Atomic increment of user session count."""
-        user = await self.get_user(user_id)
-        user.increment_session_count()
-        await self.db.flush()
+        Issued as bare DELETEs without loading the user first. Foreign keys
+        carry no ON DELETE CASCADE, so children are removed explicitly.
+
+        Raises:
+            UserNotFoundException: If the user does not exist.
+        """
+        user_session_ids = select(ChatSession.id).where(ChatSession.user_id == user_id)
+        await self.db.execute(delete(Message).where(Message.session_id.in_(user_session_ids)))
+        await self.db.execute(delete(ChatSession).where(ChatSession.user_id == user_id))
+        result = await self.db.execute(delete(User).where(User.user_id == user_id))
+        if result.rowcount == 0:
+            raise UserNotFoundException(user_id)
+        _user_cache.stage_invalidate(self.db, user_id)
+        logger.info("User deleted: %s", user_id)
 
     async def get_users_with_sessions(
         self, limit: int = 50, offset: int = 0
@@ -125,12 +152,21 @@ class UserService:
         
         Optimized to fetch users and sessions in a single query round-trip.
         """
-        # Eager load sessions to avoid N+1 query problem
+        # Eager load only active, non-empty sessions (newest first, per the
+        # relationship ordering) to avoid N+1 queries and unused rows
         stmt = (
             select(User)
-            .options(selectinload(User.sessions))
+            .options(
+                selectinload(
+                    User.sessions.and_(
+                        ChatSession.status == SessionStatus.ACTIVE,
+                        ChatSession.message_count > 0,
+                    )
+                )
+            )
             .limit(limit)
             .offset(offset)
+            .execution_options(populate_existing=True)
         )
         
         result = await self.db.execute(stmt)
@@ -140,34 +176,42 @@ class UserService:
 
     # --- Private Helper Methods ---
 
-    async def _user_exists(self, user_id: str) -> bool:
-        """Check if a user ID occupies a row in the database."""
-        result = await self.db.execute(select(User.user_id).where(User.user_id == user_id))
-        return result.first() is not None
+    @staticmethod
+    def _insert_user_stmt(
+        user_id: str,
+        name: Optional[str] = None,
+        city: Optional[str] = None,
+        session_count: int = 0,
+    ):
+        """Build an INSERT for a new user row with explicit column defaults."""
+        now = utc_now()
+        return _insert(User).values(
+            user_id=user_id,
+            name=name,
+            city=city,
+            session_count=session_count,
+            created_at=now,
+            updated_at=now,
+        )
 
     def _map_user_with_sessions(self, user: User) -> UserWithSessions:
-        """Transform a User ORM object into a Schema response object."""
-        # In-memory filtering for active sessions
-        # Note: For very large datasets, this filtering should move to the SQL query
-        active_sessions = [
-            s for s in user.sessions 
-            if s.status == SessionStatus.ACTIVE and s.message_count > 0
-        ]
-        
-        # Sort by newest first
-        active_sessions.sort(key=lambda x: x.created_at, reverse=True)
-        
+        """
+        Transform a User ORM object into a Schema response object.
+
+        Values come straight from trusted DB rows, so models are built with
+        model_construct() and skip validation.
+        """
         session_summaries = [
-            UserSessionSummary(
+            UserSessionSummary.model_construct(
                 id=s.id,
                 created_at=s.created_at,
                 status=s.status,
                 message_count=s.message_count,
             )
-            for s in active_sessions
+            for s in user.sessions
         ]
 
-        return UserWithSessions(
+        return UserWithSessions.model_construct(
             user_id=user.user_id,
             name=user.name,
             city=user.city,
@@ -0,0 +1,19 @@
+"""JSON response helpers"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    For hand-built payloads (error handlers, plain dict endpoints). Routes with
+    a response_model are already serialized straight to bytes by Pydantic, so
+    this is deliberately not installed as the app-wide default response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -1,22 +1,247 @@
 """SSE (Server-Sent Events) streaming utilities"""
 
-
+import asyncio
+from collections import deque
 from typing import AsyncGenerator
-from sse_starlette.sse import EventSourceResponse
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+
+# Headers for raw text/event-stream responses (disable proxy buffering)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# Terminal frame for plain data-only streams
+DONE_FRAME = b"data: [DONE]\n\n"
+
+# SSE comment line; ignored by clients but keeps idle connections open
+KEEPALIVE_FRAME = b": keepalive\n\n"
+KEEPALIVE_INTERVAL_SECONDS = 15.0
+# Frames read ahead of the client, so ready frames are relayed without a wait
+KEEPALIVE_READ_AHEAD = 16
+
+# Token coalescing window (time and size limits come from settings)
+COALESCE_MAX_ITEMS = 8
+
+
+# Marks the end of a pumped source
+_END = object()
+
+
+def _expire(waiter: asyncio.Future) -> None:
+    """Resolve a pump waiter whose timeout elapsed."""
+    if not waiter.done():
+        waiter.set_result(False)
+
+
+class _Pump:
+    """
+    Read an async generator on one long-lived task.
+
+    Up to `maxsize` items are buffered ahead of the consumer, which takes
+    ready items without suspending and only waits when the buffer is empty.
+    A source error is re-raised by `get_nowait` once buffered items are
+    consumed.
+    """
+
+    __slots__ = ("_source", "_maxsize", "_items", "_error", "_ready", "_space", "_task")
+
+    def __init__(self, source: AsyncGenerator, maxsize: int):
+        self._source = source
+        self._maxsize = maxsize
+        self._items: deque = deque()
+        self._error: Exception | None = None
+        self._ready: asyncio.Future | None = None
+        self._space: asyncio.Future | None = None
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            async for item in self._source:
+                self._put(item)
+                if len(self._items) >= self._maxsize:
+                    self._space = loop.create_future()
+                    await self._space
+                    self._space = None
+        except Exception as e:
+            self._error = e
+        self._put(_END)
+
+    def _put(self, item) -> None:
+        self._items.append(item)
+        if self._ready is not None and not self._ready.done():
+            self._ready.set_result(True)
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Wait for a buffered item; return False if `timeout` elapsed first."""
+        if self._items:
+            return True
+
+        loop = asyncio.get_running_loop()
+        self._ready = ready = loop.create_future()
+        timer = None if timeout is None else loop.call_later(timeout, _expire, ready)
+        try:
+            return await ready
+        finally:
+            self._ready = None
+            if timer is not None:
+                timer.cancel()
+
+    def get_nowait(self):
+        """
+        Take the next buffered item; call only after `wait` returned True.
+
+        Raises StopAsyncIteration once the source is exhausted.
+        """
+        item = self._items[0]
+        if item is _END:
+            if self._error is not None:
+                raise self._error
+            raise StopAsyncIteration
+
+        self._items.popleft()
+        if self._space is not None and not self._space.done():
+            self._space.set_result(None)
+        return item
+
+    async def aclose(self) -> None:
+        """Stop reading and close the source."""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        await self._source.aclose()
+
+
+async def with_keepalive(
+    frames: AsyncGenerator[bytes, None],
+    interval: float = KEEPALIVE_INTERVAL_SECONDS,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Relay pre-encoded SSE frames, emitting a keepalive comment whenever
+    the source stays idle for `interval` seconds.
+    """
+    pump = _Pump(frames, maxsize=KEEPALIVE_READ_AHEAD)
+    try:
+        while True:
+            if not await pump.wait(interval):
+                yield KEEPALIVE_FRAME
+                continue
+
+            try:
+                frame = pump.get_nowait()
+            except StopAsyncIteration:
+                return
+            yield frame
+    finally:
+        await pump.aclose()
+
+
+async def coalesce(
+    source: AsyncGenerator[str, None],
+    max_items: int = COALESCE_MAX_ITEMS,
+    max_wait: float | None = None,
+    max_chars: int | None = None,
+) -> AsyncGenerator[list[str], None]:
+    """
+    Group items from `source` into batches.
+
+    A batch is flushed once it holds `max_items` items or `max_chars`
+    characters, or `max_wait` seconds after its first item arrived, whichever
+    comes first. Items already buffered are flushed before a source error is
+    re-raised. A `max_wait` of 0 disables batching.
+    """
+    if max_wait is None:
+        max_wait = settings.sse_batch_max_ms / 1000
+    if max_chars is None:
+        max_chars = settings.sse_batch_max_chars
+
+    if max_wait <= 0:
+        try:
+            async for item in source:
+                yield [item]
+        finally:
+            await source.aclose()
+        return
+
+    loop = asyncio.get_running_loop()
+    pump = _Pump(source, maxsize=max_items)
+    batch: list[str] = []
+    size = 0
+    deadline = 0.0
+    try:
+        while True:
+            if batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0 or not await pump.wait(timeout):
+                    yield batch
+                    batch, size = [], 0
+                    continue
+            else:
+                await pump.wait()
+
+            try:
+                item = pump.get_nowait()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                if batch:
+                    yield batch
+                raise
+
+            if not batch:
+                deadline = loop.time() + max_wait
+            batch.append(item)
+            size += len(item)
+            if len(batch) >= max_items or size >= max_chars:
+                yield batch
+                batch, size = [], 0
+
+        if batch:
+            yield batch
+    finally:
+        await pump.aclose()
+
+
+async def batched(
+    source: AsyncGenerator[str, None],
+    max_wait: float | None = None,
+    max_chars: int | None = None,
+) -> AsyncGenerator[str, None]:
+    """Like `coalesce`, but yield each batch joined into a single string."""
+    batches = coalesce(source, max_wait=max_wait, max_chars=max_chars)
+    try:
+        async for batch in batches:
+            yield "".join(batch)
+    finally:
+        await batches.aclose()
+
+
+def data_frame(data: str) -> bytes:
+    """
+    Encode `data` as a single SSE message of `data:` lines.
+
+    Line breaks inside the payload start a new `data:` line, as required by
+    the SSE format; clients rejoin them with newlines.
+    """
+    if "\n" not in data and "\r" not in data:
+        return b"data: " + data.encode("utf-8") + b"\n\n"
+
+    lines = data.replace("\r\n", "\n").replace("\r", "\n").encode("utf-8").split(b"\n")
+    return b"".join(b"data: " + line + b"\n" for line in lines) + b"\n"
 
 
 async def create_sse_response(
     generator: AsyncGenerator[str, None],
     media_type: str = "text/event-stream",
-) -> EventSourceResponse:
+) -> StreamingResponse:
     """Create an SSE response from an async generator."""
 
     async def event_generator():
-        async for token in generator:
-            yield {"data": token}
-        yield {"data": "[DONE]"}
-
-    return EventSourceResponse(event_generator(), media_type=media_type)
-
-
+        async for text in batched(generator):
+            yield data_frame(text)
+        yield DONE_FRAME
 
+    return StreamingResponse(event_generator(), media_type=media_type, headers=SSE_HEADERS)
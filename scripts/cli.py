@@ -4,7 +4,10 @@
 import asyncio
 import signal
 import sys
+from typing import AsyncIterator
+
 import httpx
+import orjson
 from uuid import UUID, uuid4
 
 
@@ -21,6 +24,50 @@ if not API_KEY:
     print("⚠️  Warning: API_KEY not found in .env file")
 
 
+# Shape of the server's token payloads; without escapes the token is a plain slice
+TOKEN_PREFIX = b'{"token":"'
+TOKEN_SUFFIX = b'"}'
+
+
+# Streamed tokens are written to stdout at most this often (seconds)
+STDOUT_FLUSH_INTERVAL = 0.02
+
+
+class BufferedStdout:
+    """Write streamed text to stdout, flushing on newlines or a short timer."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def write(self, text: str) -> None:
+        sys.stdout.write(text)
+        if "\n" in text:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(STDOUT_FLUSH_INTERVAL, self.flush)
+
+    def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        sys.stdout.flush()
+
+
+async def iter_sse_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield raw SSE lines from a streaming response without decoding them."""
+    buf = bytearray()
+    async for chunk in response.aiter_bytes():
+        buf += chunk
+        start = 0
+        while (nl := buf.find(b"\n", start)) != -1:
+            yield bytes(buf[start:nl]).rstrip(b"\r")
+            start = nl + 1
+        del buf[:start]
+    if buf:
+        yield bytes(buf)
+
+
 async def stream_chat(
     client: httpx.AsyncClient,
     session_id: UUID,
@@ -28,9 +75,8 @@ async def stream_chat(
     user_id: str,
 ) -> None:
     """Send a message and stream the response."""
-    import json
-    
     print("\n🤖 ", end="", flush=True)
+    out = BufferedStdout()
 
     try:
         async with client.stream(
@@ -45,31 +91,41 @@ async def stream_chat(
         ) as response:
             response.raise_for_status()
 
-            async for line in response.aiter_lines():
+            async for line in iter_sse_lines(response):
                 if not line:
                     continue
 
                 # Parse SSE format
-                if line.startswith("event:"):
+                if line.startswith(b"event:"):
                     event_type = line[6:].strip()
-                    if event_type == "done":
+                    if event_type == b"done":
                         break
                     continue
 
-                if line.startswith("data:"):
+                if line.startswith(b"data:"):
                     data = line[5:].strip()
-                    if data:
+                    if (
+                        data.startswith(TOKEN_PREFIX)
+                        and data.endswith(TOKEN_SUFFIX)
+                        and b"\\" not in data
+                    ):
+                        # Fast path: no escapes, so the token needs no JSON parse
+                        token = data[len(TOKEN_PREFIX):-len(TOKEN_SUFFIX)]
+                        out.write(token.decode("utf-8"))
+                    elif data:
                         try:
-                            parsed = json.loads(data)
+                            parsed = orjson.loads(data)
                             if "token" in parsed:
-                                print(parsed["token"], end="", flush=True)
+                                out.write(parsed["token"])
                             elif "error" in parsed:
-                                print(f"\n❌ Error: {parsed['error']}")
-                        except json.JSONDecodeError:
+                                out.write(f"\n❌ Error: {parsed['error']}\n")
+                        except orjson.JSONDecodeError:
                             pass
     except asyncio.CancelledError:
         print("\n[Cancelled]")
         raise
+    finally:
+        out.flush()
 
     print()  # New line after response
 
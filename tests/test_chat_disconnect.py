@@ -0,0 +1,97 @@
+"""Chat streaming stops when the client disconnects."""
+
+import asyncio
+import os
+import unittest
+from uuid import uuid4
+
+os.environ.setdefault("GROQ_API_KEY", "gsk_test")
+
+from app.api.deps import get_chat_service  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+class _EndlessChatService:
+    """Chat service stand-in whose reply never ends on its own."""
+
+    def __init__(self):
+        self.tokens = 0
+        self.closed = asyncio.Event()
+
+    async def resolve_session(self, session_id, user_id):
+        return uuid4()
+
+    async def handle_chat(self, user_message, session_id, user_id):
+        try:
+            while True:
+                await asyncio.sleep(0.001)
+                self.tokens += 1
+                yield "token "
+        finally:
+            self.closed.set()
+
+
+class ChatDisconnectTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = _EndlessChatService()
+        app.dependency_overrides[get_chat_service] = lambda: self.service
+
+    async def asyncTearDown(self):
+        app.dependency_overrides.pop(get_chat_service, None)
+
+    async def _stream_until_disconnect(self, spec_version: str) -> None:
+        """POST /chat, then disconnect after the third token frame."""
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": spec_version},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/api/v1/chat",
+            "raw_path": b"/api/v1/chat",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"content-type", b"application/json"),
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        body_sent = False
+        client_gone = asyncio.Event()
+        token_frames = 0
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": b'{"message": "hi"}', "more_body": False}
+            await client_gone.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal token_frames
+            if message["type"] == "http.response.body" and b"event: token" in message.get("body", b""):
+                token_frames += 1
+                if token_frames == 3:
+                    client_gone.set()
+
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+        await asyncio.wait_for(self.service.closed.wait(), timeout=5)
+
+        # The token source stays closed once the client is gone
+        tokens = self.service.tokens
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.service.tokens, tokens)
+
+    async def test_disconnect_closes_token_source(self):
+        # Starlette listens for http.disconnect itself before ASGI spec 2.4
+        await self._stream_until_disconnect("2.3")
+
+    async def test_disconnect_closes_token_source_without_server_listener(self):
+        # From spec 2.4 only the endpoint's own disconnect check stops the stream
+        await self._stream_until_disconnect("2.4")
+
+if __name__ == "__main__":
+    unittest.main()